@@ -33,6 +33,7 @@ from enum import Enum
 from decimal import Decimal
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.orm import selectinload
 
 logger = logging.getLogger("flask.app")
 
@@ -72,12 +73,12 @@ class Product(db.Model):
     # Table Schema
     ##################################################
     id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(100), nullable=False)
+    name = db.Column(db.String(100), nullable=False, index=True)
     description = db.Column(db.String(250), nullable=False)
     price = db.Column(db.Numeric, nullable=False)
-    available = db.Column(db.Boolean(), nullable=False, default=True)
+    available = db.Column(db.Boolean(), nullable=False, default=True, index=True)
     category = db.Column(
-        db.Enum(Category), nullable=False, server_default=(Category.UNKNOWN.name)
+        db.Enum(Category), nullable=False, server_default=(Category.UNKNOWN.name), index=True
     )
 
     ##################################################
@@ -175,6 +176,21 @@ class Product(db.Model):
         logger.info("Processing all Products")
         return cls.query.all()
 
+    @classmethod
+    def count(cls, **filters) -> int:
+        """Returns the number of Products in the database
+
+        :param filters: optional column values the Products must match,
+            e.g. ``category=Category.FOOD``
+        :type filters: dict
+
+        :return: the number of matching Products
+        :rtype: int
+
+        """
+        logger.info("Processing count query for %s ...", filters)
+        return db.session.scalar(db.select(db.func.count(cls.id)).filter_by(**filters))
+
     @classmethod
     def find(cls, product_id: int):
         """Finds a Product by it's ID
@@ -187,7 +203,8 @@ class Product(db.Model):
 
         """
         logger.info("Processing lookup for id %s ...", product_id)
-        return cls.query.get(product_id)
+        # eager load any relationships so reading the Product never lazy loads
+        return db.session.get(cls, product_id, options=[selectinload("*")])
 
     @classmethod
     def find_by_name(cls, name: str) -> list:
@@ -201,7 +218,7 @@ class Product(db.Model):
 
         """
         logger.info("Processing name query for %s ...", name)
-        return cls.query.filter(cls.name == name)
+        return cls.query.filter(cls.name == name).all()
 
     @classmethod
     def find_by_price(cls, price: Decimal) -> list:
@@ -218,7 +235,7 @@ class Product(db.Model):
         price_value = price
         if isinstance(price, str):
             price_value = Decimal(price.strip(' "'))
-        return cls.query.filter(cls.price == price_value)
+        return cls.query.filter(cls.price == price_value).all()
 
     @classmethod
     def find_by_availability(cls, available: bool = True) -> list:
@@ -232,7 +249,7 @@ class Product(db.Model):
 
         """
         logger.info("Processing available query for %s ...", available)
-        return cls.query.filter(cls.available == available)
+        return cls.query.filter(cls.available == available).all()
 
     @classmethod
     def find_by_category(cls, category: Category = Category.UNKNOWN) -> list:
@@ -246,4 +263,4 @@ class Product(db.Model):
 
         """
         logger.info("Processing category query for %s ...", category.name)
-        return cls.query.filter(cls.category == category)
+        return cls.query.filter(cls.category == category).all()
@@ -0,0 +1,71 @@
+"""
+Test package for the Product Store Service
+
+Unit tests default to an in-memory SQLite database so they run without a
+PostgreSQL server. Set DATABASE_URI to run them against PostgreSQL (e.g. in CI).
+
+When the suite runs in parallel with ``pytest -n auto`` every pytest-xdist
+worker gets its own PostgreSQL database so workers never see each other's rows.
+"""
+import os
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+
+# must be set before the service package is imported and connects
+os.environ.setdefault("DATABASE_URI", "sqlite:///:memory:")
+
+# the database the suite was pointed at, before any per-worker renaming
+ADMIN_DATABASE_URI = os.environ["DATABASE_URI"]
+XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+
+_ENGINE_READY = False
+
+
+def _run_admin_sql(statement: str):
+    """Runs a statement outside of a transaction on the admin database"""
+    engine = create_engine(ADMIN_DATABASE_URI, isolation_level="AUTOCOMMIT")
+    with engine.connect() as connection:
+        connection.execute(text(statement))
+    engine.dispose()
+
+
+def create_worker_database():
+    """Creates a fresh database for this xdist worker and points DATABASE_URI at it"""
+    url = make_url(ADMIN_DATABASE_URI)
+    url = url.set(database=f"{url.database}_{XDIST_WORKER}")
+    _run_admin_sql(f'DROP DATABASE IF EXISTS "{url.database}"')
+    _run_admin_sql(f'CREATE DATABASE "{url.database}"')
+    os.environ["DATABASE_URI"] = url.render_as_string(hide_password=False)
+
+
+def drop_worker_database():
+    """Drops the database created by create_worker_database()"""
+    database = make_url(os.environ["DATABASE_URI"]).database
+    # FORCE (PostgreSQL 13+) closes any connection still left in the service's own pool
+    _run_admin_sql(f'DROP DATABASE IF EXISTS "{database}" WITH (FORCE)')
+
+
+def uses_worker_database() -> bool:
+    """Returns True when this process is an xdist worker running against PostgreSQL"""
+    return bool(XDIST_WORKER) and make_url(ADMIN_DATABASE_URI).get_backend_name() == "postgresql"
+
+
+if uses_worker_database():
+    create_worker_database()
+
+
+def init_db_once(app):
+    """Initializes the database engine and tables once for the whole test session
+
+    :param app: the Flask app
+    :type app: Flask
+
+    """
+    global _ENGINE_READY  # pylint: disable=global-statement
+    if _ENGINE_READY:
+        return
+    # imported here so the DATABASE_URI default above is in place first
+    from service.models import Product  # pylint: disable=import-outside-toplevel
+
+    Product.init_db(app)
+    _ENGINE_READY = True
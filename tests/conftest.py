@@ -0,0 +1,86 @@
+######################################################################
+# Copyright 2016, 2023 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+"""
+Shared pytest fixtures
+
+The engine is created once per test session (once per pytest-xdist worker
+with ``-n auto``), each test module shares one connection inside an outer
+transaction, and every test that asks for ``db_session`` runs inside a
+SAVEPOINT that is rolled back after it.
+"""
+import os
+import logging
+import pytest
+from sqlalchemy.orm import scoped_session, sessionmaker
+from service import app
+from service.models import db
+from tests import init_db_once, uses_worker_database, drop_worker_database
+from tests.factories import build_product_pool
+
+
+@pytest.fixture(scope="session", autouse=True)
+def worker_database():
+    """Drops this xdist worker's PostgreSQL database at the end of the session"""
+    yield
+    if uses_worker_database():
+        db.engine.dispose()  # close pooled connections so the drop can proceed
+        drop_worker_database()
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """Initializes the test database once and yields its engine"""
+    app.config["TESTING"] = True
+    app.config["DEBUG"] = False
+    # tests/__init__.py has already set the default (or per-worker) database
+    app.config["SQLALCHEMY_DATABASE_URI"] = os.environ["DATABASE_URI"]
+    app.logger.setLevel(logging.CRITICAL)
+    init_db_once(app)
+    yield db.engine
+
+
+@pytest.fixture(scope="module")
+def db_connection(db_engine):  # pylint: disable=redefined-outer-name
+    """Binds db.session to one connection whose outer transaction is never committed"""
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    # Flask-SQLAlchemy ignores session.configure(bind=...), so swap in a
+    # session bound to our connection for the duration of the module
+    app_session = db.session
+    db.session = scoped_session(
+        sessionmaker(bind=connection, join_transaction_mode="create_savepoint")
+    )
+    yield connection
+    db.session.remove()
+    db.session = app_session
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def db_session(db_connection):  # pylint: disable=redefined-outer-name
+    """Runs a test inside a SAVEPOINT that is rolled back afterwards"""
+    savepoint = db_connection.begin_nested()
+    yield db.session
+    db.session.rollback()
+    db.session.remove()
+    savepoint.rollback()
+
+
+@pytest.fixture(scope="module")
+def product_pool():
+    """Attributes of fake products built once per module"""
+    return build_product_pool()
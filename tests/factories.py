@@ -69,3 +69,16 @@ class ProductFactory(factory.Factory):
             Category.TOOLS,
         ]
     )
+
+
+def build_product_pool(count: int = 20) -> list:
+    """Builds the attributes of some fake products once so tests can reuse them
+
+    Faker is slow, so tests pick from this pool with random.choice()
+    instead of calling ProductFactory() every time.
+    """
+    fields = ("name", "description", "price", "available", "category")
+    return [
+        {field: getattr(product, field) for field in fields}
+        for product in ProductFactory.build_batch(count)
+    ]